@@ -7,17 +7,21 @@ to keep speakers or audio devices active.
 """
 import os
 import sys
-import time
+import asyncio
 import logging
 import signal
-import schedule
-from typing import List, NoReturn
+from logging.handlers import RotatingFileHandler
+from typing import List, Optional
 
 from src.config.settings import Settings
 from src.utils.file_utils import AudioFileManager
 from src.audio.player import AudioPlayer
 
 
+# Mapping of log level names to logging constants
+LOG_LEVELS = logging.getLevelNamesMapping()
+
+
 class KeepSpeakerOn:
     """
     Main application class for Keep Speaker On.
@@ -36,12 +40,12 @@ class KeepSpeakerOn:
         self.file_manager = AudioFileManager()
         self.player = AudioPlayer()
         
-        # Flag to control the main loop
-        self.running = True
+        # Event to stop the main loop
+        self._stop_event = asyncio.Event()
         
-        # Register signal handlers
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
+        # Event loop running the main loop and the current playback task
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._playback_task: Optional[asyncio.Task] = None
     
     def _setup_logging(self) -> None:
         """
@@ -51,14 +55,17 @@ class KeepSpeakerOn:
         log_file = self.settings.get_log_file()
         
         # Convert string log level to logging constant
-        log_level = getattr(logging, log_level_str.upper(), logging.INFO)
+        log_level = LOG_LEVELS.get(log_level_str.upper(), logging.INFO)
         
-        # Configure logging
+        # Configure logging. Settings may already have logged a warning, which
+        # configures the root logger implicitly, so replace those handlers.
         logging.basicConfig(
+            force=True,
             level=log_level,
             format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             handlers=[
-                logging.FileHandler(log_file),
+                # Rotate to bound disk usage, open the file on first write
+                RotatingFileHandler(log_file, maxBytes=1_000_000, backupCount=3, delay=True),
                 logging.StreamHandler(sys.stdout)
             ]
         )
@@ -73,9 +80,10 @@ class KeepSpeakerOn:
             sig: Signal number
             frame: Current stack frame
         """
-        logging.info(f"Received signal {sig}, shutting down...")
-        self.running = False
-        self.player.stop()
+        logging.info("Received signal %s, shutting down...", sig)
+        # The handler may interrupt the event loop itself, so wake it safely.
+        # The main loop stops the player once it wakes up.
+        self._loop.call_soon_threadsafe(self._stop_event.set)
     
     def play_audio(self) -> None:
         """
@@ -87,33 +95,94 @@ class KeepSpeakerOn:
             logging.warning("No audio files found to play")
             return
         
-        logging.info(f"Playing {len(audio_files)} audio file(s)")
+        # Only decodes again when the input directory was rescanned
+        self.player.preload(audio_files, self.file_manager.get_scan_generation())
+        
+        logging.info("Playing %s audio file(s)", len(audio_files))
         self.player.play_files(audio_files)
     
-    def run(self) -> NoReturn:
+    def _start_playback(self) -> None:
+        """
+        Start playing the audio files in a worker thread.
+        
+        If the previous playback is still running, this interval is skipped
+        instead of queuing another playback behind it.
+        """
+        if self._playback_task is not None and not self._playback_task.done():
+            logging.warning("Previous playback still running, skipping this interval")
+            return
+        
+        self._playback_task = asyncio.create_task(self._play_audio_async())
+    
+    async def _play_audio_async(self) -> None:
+        """
+        Play all audio files without blocking the event loop.
+        """
+        try:
+            await asyncio.to_thread(self.play_audio)
+        except Exception as e:
+            logging.error("Error during playback: %s", e)
+    
+    async def _run_interval_deadlines(self, interval_seconds: float) -> None:
+        """
+        Start playback at fixed deadlines until a stop is requested.
+        
+        wait_for arms a single event loop timer per interval, so the process
+        only wakes up when playback is due or a stop is requested.
+        
+        Args:
+            interval_seconds: Interval between playbacks in seconds
+        """
+        next_deadline = self._loop.time()
+        
+        # Sleep until the next interval or until a stop is requested
+        while True:
+            next_deadline += interval_seconds
+            remaining = next_deadline - self._loop.time()
+            
+            # After the clock jumped, e.g. on resume from suspend, the overdue
+            # tick has just played, so schedule the next one a full interval
+            # from now instead of catching up on every missed interval
+            if remaining <= 0:
+                next_deadline = self._loop.time() + interval_seconds
+                remaining = interval_seconds
+            
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=remaining)
+                return
+            except asyncio.TimeoutError:
+                self._start_playback()
+    
+    async def run(self) -> None:
         """
         Run the application.
         """
         interval_minutes = self.settings.get_interval_minutes()
+        interval_seconds = interval_minutes * 60
         
-        logging.info(f"Starting Keep Speaker On with {interval_minutes} minute interval")
+        self._loop = asyncio.get_running_loop()
         
-        # Schedule the audio playback
-        schedule.every(interval_minutes).minutes.do(self.play_audio)
+        # Register signal handlers
+        signal.signal(signal.SIGINT, self._signal_handler)
+        signal.signal(signal.SIGTERM, self._signal_handler)
         
-        # Play once at startup
-        self.play_audio()
+        logging.info("Starting Keep Speaker On with %s minute interval", interval_minutes)
         
         # Main loop
         try:
-            while self.running:
-                schedule.run_pending()
-                time.sleep(1)
+            # Play once at startup
+            self._start_playback()
+            
+            await self._run_interval_deadlines(interval_seconds)
         except KeyboardInterrupt:
             logging.info("Keyboard interrupt received, shutting down...")
         except Exception as e:
-            logging.error(f"Unexpected error: {e}")
+            logging.error("Unexpected error: %s", e)
         finally:
+            # Let the worker thread finish before the streams are closed
+            if self._playback_task is not None and not self._playback_task.done():
+                self.player.stop()
+                await self._playback_task
             self.cleanup()
     
     def cleanup(self) -> None:
@@ -130,7 +199,7 @@ def main():
     Main entry point for the application.
     """
     app = KeepSpeakerOn()
-    app.run()
+    asyncio.run(app.run())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,136 @@
+"""
+Audio decoder module for loading sound files into memory.
+"""
+import os
+import functools
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, List
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+@dataclass(frozen=True)
+class AudioBuffer:
+    """
+    Decoded audio samples of a file.
+    """
+    data: "np.ndarray"
+    samplerate: int
+
+    @property
+    def channels(self) -> int:
+        """
+        Get the number of channels of the audio data.
+
+        Returns:
+            The number of channels
+        """
+        return self.data.shape[1]
+
+
+def convert_buffer(buffer: AudioBuffer, samplerate: int, channels: int) -> AudioBuffer:
+    """
+    Convert an audio buffer to the given sample rate and channel count.
+
+    Mono is copied to every channel and mixed down by averaging. Other
+    channel counts map output channels onto the source channels in turn.
+    The sample rate is converted by linear interpolation, which is good
+    enough for the short tones this application plays.
+
+    Args:
+        buffer: Audio buffer to convert
+        samplerate: Target sample rate
+        channels: Target number of channels
+
+    Returns:
+        The converted audio buffer, or the given buffer if it already matches
+    """
+    if buffer.samplerate == samplerate and buffer.channels == channels:
+        return buffer
+
+    import numpy as np
+
+    data = buffer.data
+
+    if buffer.channels != channels:
+        if buffer.channels == 1:
+            data = np.repeat(data, channels, axis=1)
+        elif channels == 1:
+            data = data.mean(axis=1, keepdims=True)
+        else:
+            data = data[:, np.arange(channels) % buffer.channels]
+
+    if buffer.samplerate != samplerate and len(data):
+        frames = round(len(data) * samplerate / buffer.samplerate)
+        source_times = np.arange(len(data)) / buffer.samplerate
+        target_times = np.arange(frames) / samplerate
+        data = np.column_stack([
+            np.interp(target_times, source_times, data[:, channel])
+            for channel in range(channels)
+        ])
+
+    return AudioBuffer(data=np.ascontiguousarray(data, dtype=np.float32), samplerate=samplerate)
+
+
+@functools.lru_cache(maxsize=32)
+def _decode(file_path: str, mtime_ns: int, size: int, samplerate: int, channels: int) -> AudioBuffer:
+    """
+    Decode an audio file into float32 samples in the given format.
+
+    The modification time and size are only part of the cache key, so a
+    changed file is decoded again instead of served from the cache.
+
+    Args:
+        file_path: Path to the audio file
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
+        samplerate: Sample rate to convert the audio to
+        channels: Number of channels to convert the audio to
+
+    Returns:
+        The decoded audio buffer
+    """
+    # Imported on first decode to keep application startup light
+    import soundfile as sf
+
+    data, file_samplerate = sf.read(file_path, dtype='float32', always_2d=True)
+    return convert_buffer(AudioBuffer(data=data, samplerate=file_samplerate), samplerate, channels)
+
+
+def load_audio(file_path: str, samplerate: int, channels: int) -> AudioBuffer:
+    """
+    Load an audio file, reusing the decoded samples if the file is unchanged.
+
+    Args:
+        file_path: Path to the audio file
+        samplerate: Sample rate to convert the audio to
+        channels: Number of channels to convert the audio to
+
+    Returns:
+        The decoded audio buffer in the given format
+
+    Raises:
+        OSError: If the file cannot be accessed
+    """
+    st = os.stat(file_path)
+    return _decode(file_path, st.st_mtime_ns, st.st_size, samplerate, channels)
+
+
+def concatenate_buffers(buffers: List[AudioBuffer]) -> AudioBuffer:
+    """
+    Join audio buffers of the same format into a single buffer.
+
+    Args:
+        buffers: Audio buffers with equal sample rate and channel count
+
+    Returns:
+        The joined audio buffer
+    """
+    if len(buffers) == 1:
+        return buffers[0]
+
+    import numpy as np
+
+    data = np.concatenate([buffer.data for buffer in buffers])
+    return AudioBuffer(data=data, samplerate=buffers[0].samplerate)
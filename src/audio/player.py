@@ -2,101 +2,336 @@
 Audio player module for playing sound files.
 """
 import os
-import time
 import logging
-import pygame
-from typing import List, Optional
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from src.audio.decoder import AudioBuffer, concatenate_buffers, load_audio
+
+if TYPE_CHECKING:
+    import sounddevice as sd
+
+
+@dataclass(frozen=True)
+class _PlaybackBatch:
+    """
+    Audio files joined into one buffer in the output stream format.
+    """
+    file_paths: Tuple[str, ...]
+    buffer: AudioBuffer
 
 
 class AudioPlayer:
     """
-    Class to play audio files using pygame.
+    Class to play audio files using a sounddevice output stream.
     """
+    # Number of frames handed to the output stream per write call
+    WRITE_FRAMES = 4096
+
     def __init__(self):
         """
         Initialize the audio player.
         """
-        self._initialize_pygame()
-    
-    def _initialize_pygame(self) -> None:
+        # The single output stream and its format, opened on first playback
+        self._stream: Optional["sd.OutputStream"] = None
+        self._samplerate = 0
+        self._channels = 0
+
+        # Set by stop() to end playback until cleanup
+        self._stop_requested = False
+
+        # Decoded audio of the preloaded files keyed by path
+        self._preloaded: Dict[str, AudioBuffer] = {}
+        self._preloaded_paths: List[str] = []
+        self._preloaded_generation: Optional[int] = None
+        self._preloaded_stats: List[Optional[Tuple[int, int]]] = []
+        self._preloaded_batch: Optional[_PlaybackBatch] = None
+
+    def _open_default_stream(self) -> None:
         """
-        Initialize pygame mixer for audio playback.
+        Open and start the output stream in the default device format.
+
+        This is deferred until the first playback and does nothing once the
+        stream has been opened. The stream then stays running until cleanup.
+        Between playbacks it outputs silence, which keeps the audio device
+        from idling out. All audio is converted to this format when it is
+        decoded, so no other stream is ever opened.
         """
+        if self._stream is not None:
+            return
+
+        # Imported on first playback to keep application startup light
         try:
-            pygame.mixer.init()
-            logging.info("Pygame mixer initialized successfully")
-        except pygame.error as e:
-            logging.error(f"Failed to initialize pygame mixer: {e}")
+            import sounddevice as sd
+        except (ImportError, OSError) as e:
+            logging.error("Failed to load sounddevice: %s", e)
             raise RuntimeError(f"Failed to initialize audio system: {e}")
-    
+
+        try:
+            device = sd.query_devices(kind='output')
+            samplerate = int(device['default_samplerate'])
+            channels = min(2, device['max_output_channels'])
+
+            stream = sd.OutputStream(
+                samplerate=samplerate,
+                channels=channels,
+                dtype='float32',
+                blocksize=2048,
+                latency='high'
+            )
+            stream.start()
+        except sd.PortAudioError as e:
+            logging.error("Failed to open output stream: %s", e)
+            raise RuntimeError(f"Failed to initialize audio system: {e}")
+
+        self._stream = stream
+        self._samplerate = samplerate
+        self._channels = channels
+        logging.info("Output stream opened (%s Hz, %s channel(s))", samplerate, channels)
+
+    def _initialize_stream(self) -> "sd.OutputStream":
+        """
+        Get the started output stream, opening it on first use.
+
+        Returns:
+            A started output stream
+        """
+        self._open_default_stream()
+        return self._stream
+
+    def preload(self, file_paths: List[str], generation: int) -> None:
+        """
+        Decode audio files once so later playback needs no file access.
+
+        Calling this again with the same paths and generation keeps the
+        preloaded audio as long as every file still has the same modification
+        time and size, which costs one stat per file. Any other generation
+        decodes the files again, so pass a value that changes whenever the
+        input directory was rescanned. Files overwritten in place leave the
+        directory unchanged but are detected by their stat. Files that failed
+        to load are retried on every call, for example when they were scanned
+        while still being copied. Unchanged files are served from the decode
+        cache.
+
+        Args:
+            file_paths: List of paths to audio files
+            generation: Scan generation the file list belongs to
+        """
+        stats = self._stat_files(file_paths)
+
+        if (generation == self._preloaded_generation
+                and list(file_paths) == self._preloaded_paths
+                and len(self._preloaded) == len(self._preloaded_paths)
+                and stats == self._preloaded_stats):
+            return
+
+        # The stream format decides what the audio is converted to
+        self._open_default_stream()
+
+        loaded = []
+
+        for file_path in file_paths:
+            try:
+                loaded.append((file_path, load_audio(file_path, self._samplerate, self._channels)))
+            except Exception as e:
+                logging.error("Error preloading audio file %s: %s", file_path, e)
+
+        self._preloaded = dict(loaded)
+        self._preloaded_paths = list(file_paths)
+        self._preloaded_generation = generation
+        self._preloaded_stats = stats
+        self._preloaded_batch = self._build_batch(loaded)
+        logging.info("Preloaded %s audio file(s)", len(loaded))
+
+    def _stat_files(self, file_paths: List[str]) -> List[Optional[Tuple[int, int]]]:
+        """
+        Get the modification time and size of each file.
+
+        Args:
+            file_paths: List of paths to audio files
+
+        Returns:
+            List of (mtime_ns, size) tuples, or None for files that cannot be accessed
+        """
+        stats = []
+
+        for file_path in file_paths:
+            try:
+                st = os.stat(file_path)
+                stats.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                stats.append(None)
+
+        return stats
+
+    def _get_buffer(self, file_path: str) -> Optional[AudioBuffer]:
+        """
+        Get the decoded audio of a file, preferring the preloaded audio.
+
+        Args:
+            file_path: Path to the audio file
+
+        Returns:
+            The decoded audio buffer, or None if the file could not be loaded
+        """
+        buffer = self._preloaded.get(file_path)
+        if buffer is not None:
+            return buffer
+
+        try:
+            return load_audio(file_path, self._samplerate, self._channels)
+        except FileNotFoundError:
+            logging.error("Audio file not found: %s", file_path)
+        except Exception as e:
+            logging.error("Error loading audio file %s: %s", file_path, e)
+        return None
+
+    def _build_batch(self, loaded: List[Tuple[str, AudioBuffer]]) -> Optional[_PlaybackBatch]:
+        """
+        Join decoded files into a single playback batch.
+
+        Args:
+            loaded: List of (file path, decoded audio) pairs in playback order
+
+        Returns:
+            The playback batch, or None if no file was loaded
+        """
+        if not loaded:
+            return None
+
+        file_paths, buffers = zip(*loaded)
+        return _PlaybackBatch(file_paths=file_paths, buffer=concatenate_buffers(list(buffers)))
+
     def play_file(self, file_path: str) -> bool:
         """
         Play an audio file.
-        
+
         Args:
             file_path: Path to the audio file
-            
+
         Returns:
-            True if playback started successfully, False otherwise
+            True if playback finished successfully, False otherwise
         """
-        if not os.path.exists(file_path):
-            logging.error(f"Audio file not found: {file_path}")
+        self._open_default_stream()
+
+        buffer = self._get_buffer(file_path)
+        if buffer is None:
             return False
-        
+
+        return self._write(buffer, file_path)
+
+    def _write(self, buffer: AudioBuffer, description: str) -> bool:
+        """
+        Write audio to the output stream until it finishes or a stop is requested.
+
+        Args:
+            buffer: Decoded audio in the output stream format
+            description: Name of the played audio used in log messages
+
+        Returns:
+            True if playback finished successfully, False otherwise
+        """
+        # A stop may arrive before playback starts, e.g. while preloading
+        if self._stop_requested:
+            logging.info("Playback stopped: %s", description)
+            return False
+
         try:
-            pygame.mixer.music.load(file_path)
-            pygame.mixer.music.play()
-            
-            logging.info(f"Playing audio file: {file_path}")
-            
-            # Wait for playback to finish
-            while pygame.mixer.music.get_busy():
-                time.sleep(0.1)
-            
-            logging.info(f"Finished playing: {file_path}")
+            data = buffer.data
+            stream = self._initialize_stream()
+
+            logging.info("Playing audio file: %s", description)
+
+            # write() blocks until the block has been queued, so no polling is needed.
+            # Writing in blocks keeps the loop responsive to stop().
+            for i in range(0, len(data), self.WRITE_FRAMES):
+                if self._stop_requested:
+                    logging.info("Playback stopped: %s", description)
+                    return False
+                stream.write(data[i:i + self.WRITE_FRAMES])
+
+            logging.info("Finished playing: %s", description)
             return True
         except Exception as e:
-            logging.error(f"Error playing audio file {file_path}: {e}")
+            # stop() aborts the stream, which makes an in-flight write() fail
+            if self._stop_requested:
+                logging.info("Playback stopped: %s", description)
+            else:
+                logging.error("Error playing audio file %s: %s", description, e)
             return False
-    
+
     def play_files(self, file_paths: List[str]) -> int:
         """
         Play multiple audio files in sequence.
-        
+
+        The files are joined and written to the output stream as one
+        contiguous buffer.
+
         Args:
             file_paths: List of paths to audio files
-            
+
         Returns:
             Number of files played successfully
         """
         if not file_paths:
             logging.warning("No audio files to play")
             return 0
-        
-        success_count = 0
-        
-        for file_path in file_paths:
-            if self.play_file(file_path):
-                success_count += 1
-        
-        return success_count
-    
+
+        self._open_default_stream()
+
+        if list(file_paths) == self._preloaded_paths:
+            batch = self._preloaded_batch
+        else:
+            loaded = []
+            for file_path in file_paths:
+                buffer = self._get_buffer(file_path)
+                if buffer is not None:
+                    loaded.append((file_path, buffer))
+            batch = self._build_batch(loaded)
+
+        if batch is None or not self._write(batch.buffer, ", ".join(batch.file_paths)):
+            return 0
+
+        return len(batch.file_paths)
+
     def stop(self) -> None:
         """
         Stop any currently playing audio.
+
+        The player stays stopped until cleanup(), so a playback that has not
+        reached the output stream yet does not start either.
         """
+        self._stop_requested = True
+
+        if self._stream is None:
+            return
+
         try:
-            pygame.mixer.music.stop()
+            # abort() discards pending data and unblocks write() immediately
+            self._stream.abort()
             logging.info("Stopped audio playback")
         except Exception as e:
-            logging.error(f"Error stopping playback: {e}")
-    
+            logging.error("Error stopping playback: %s", e)
+
     def cleanup(self) -> None:
         """
-        Clean up pygame resources.
+        Clean up output stream resources.
         """
+        self._stop_requested = False
+
+        if self._stream is None:
+            return
+
         try:
-            pygame.mixer.quit()
-            logging.info("Pygame mixer resources released")
+            self._stream.close()
+            logging.info("Output stream resources released")
         except Exception as e:
-            logging.error(f"Error cleaning up pygame mixer: {e}")
+            logging.error("Error cleaning up output stream: %s", e)
+        finally:
+            # A reopened stream may use another format, so decode again
+            self._stream = None
+            self._preloaded = {}
+            self._preloaded_paths = []
+            self._preloaded_generation = None
+            self._preloaded_stats = []
+            self._preloaded_batch = None
@@ -2,9 +2,21 @@
 Settings handler for the application.
 """
 import configparser
-import os
+import io
+import locale
 import logging
-from typing import Dict, Any
+from pathlib import Path
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class _SettingsValues:
+    """
+    Parsed settings values.
+    """
+    interval_minutes: int
+    log_level: str
+    log_file: str
 
 
 class Settings:
@@ -33,152 +45,113 @@ class Settings:
         }
         
         self.load_config()
+        self._values = self._parse_values()
     
     def load_config(self) -> None:
         """
         Load configuration from the config file.
         If settings.ini doesn't exist but settings_example.ini does, copy from example.
         If neither exists, create settings.ini with default values.
+        The configuration text is read and parsed only once.
         """
         example_config = "settings_example.ini"
+        config_path = Path(self.config_file)
         
-        if not os.path.exists(self.config_file):
-            if os.path.exists(example_config):
-                logging.info(f"Creating {self.config_file} from {example_config}")
-                # Copy from example
-                example = configparser.ConfigParser()
-                example.read(example_config)
-                
-                # Create new config with example values
-                self.config = example
+        try:
+            try:
+                text = self._read_text(config_path)
+            except FileNotFoundError:
+                try:
+                    # Copy from example
+                    text = self._read_text(Path(example_config))
+                    logging.info("Creating %s from %s", self.config_file, example_config)
+                except FileNotFoundError:
+                    # No example found, create with defaults
+                    text = self._default_config_text()
                 
                 # Save to settings.ini
-                with open(self.config_file, 'w') as f:
-                    self.config.write(f)
-            else:
-                # No example found, create with defaults
-                self._create_default_config()
+                config_path.write_text(text, encoding='utf-8')
+        except UnicodeDecodeError as e:
+            logging.error("Error decoding config file, using defaults: %s", e)
+            self._set_defaults()
+            return
         
         try:
-            self.config.read(self.config_file)
+            self.config.read_string(text, source=self.config_file)
         except configparser.Error as e:
-            logging.error(f"Error reading config file: {e}")
+            logging.error("Error reading config file: %s", e)
             self._set_defaults()
     
-    def _create_default_config(self) -> None:
-        """Create a default configuration file."""
-        self._set_defaults()
-        with open(self.config_file, 'w') as f:
-            self.config.write(f)
-    
-    def _set_defaults(self) -> None:
-        """Set default values for configuration."""
-        for section, options in self.defaults.items():
-            if not self.config.has_section(section):
-                self.config.add_section(section)
-            
-            for option, value in options.items():
-                self.config.set(section, option, value)
-    
-    def get(self, section: str, option: str, fallback: Any = None) -> str:
+    def _read_text(self, path: Path) -> str:
         """
-        Get a configuration value.
+        Read a configuration file as text.
+        
+        UTF-8 is tried first, with or without a byte order mark. Files that are
+        not valid UTF-8, such as ANSI files saved by Notepad, are read with the
+        locale encoding like configparser does by default.
         
         Args:
-            section: Configuration section
-            option: Option name
-            fallback: Fallback value if option is not found
+            path: Path to the configuration file
             
         Returns:
-            The configuration value as a string
-        """
-        try:
-            return self.config.get(section, option)
-        except (configparser.NoSectionError, configparser.NoOptionError):
-            if fallback is not None:
-                return fallback
+            The content of the file
             
-            # Try to get from defaults
-            try:
-                return self.defaults[section][option]
-            except KeyError:
-                logging.warning(f"Configuration {section}.{option} not found")
-                return ""
-    
-    def get_int(self, section: str, option: str, fallback: int = None) -> int:
+        Raises:
+            FileNotFoundError: If the file does not exist
+            UnicodeDecodeError: If the file is not valid in either encoding
         """
-        Get a configuration value as an integer.
+        data = path.read_bytes()
         
-        Args:
-            section: Configuration section
-            option: Option name
-            fallback: Fallback value if option is not found or not an integer
-            
-        Returns:
-            The configuration value as an integer
-        """
         try:
-            return self.config.getint(section, option)
-        except (configparser.NoSectionError, configparser.NoOptionError, ValueError):
-            if fallback is not None:
-                return fallback
-            
-            # Try to get from defaults
-            try:
-                return int(self.defaults[section][option])
-            except (KeyError, ValueError):
-                logging.warning(f"Configuration {section}.{option} not found or not an integer")
-                return 0
+            return data.decode('utf-8-sig')
+        except UnicodeDecodeError:
+            return data.decode(locale.getpreferredencoding(False))
     
-    def get_float(self, section: str, option: str, fallback: float = None) -> float:
+    def _default_config_text(self) -> str:
         """
-        Get a configuration value as a float.
+        Build the text of a default configuration file.
         
-        Args:
-            section: Configuration section
-            option: Option name
-            fallback: Fallback value if option is not found or not a float
-            
         Returns:
-            The configuration value as a float
+            The default configuration in INI format
         """
-        try:
-            return self.config.getfloat(section, option)
-        except (configparser.NoSectionError, configparser.NoOptionError, ValueError):
-            if fallback is not None:
-                return fallback
+        defaults = configparser.ConfigParser()
+        defaults.read_dict(self.defaults)
+        
+        buffer = io.StringIO()
+        defaults.write(buffer)
+        return buffer.getvalue()
+    
+    def _set_defaults(self) -> None:
+        """Set default values for configuration."""
+        for section, options in self.defaults.items():
+            if not self.config.has_section(section):
+                self.config.add_section(section)
             
-            # Try to get from defaults
-            try:
-                return float(self.defaults[section][option])
-            except (KeyError, ValueError):
-                logging.warning(f"Configuration {section}.{option} not found or not a float")
-                return 0.0
+            for option, value in options.items():
+                self.config.set(section, option, value)
     
-    def get_boolean(self, section: str, option: str, fallback: bool = None) -> bool:
+    def _parse_values(self) -> _SettingsValues:
         """
-        Get a configuration value as a boolean.
+        Parse the loaded configuration into typed values.
         
-        Args:
-            section: Configuration section
-            option: Option name
-            fallback: Fallback value if option is not found or not a boolean
-            
         Returns:
-            The configuration value as a boolean
+            The parsed settings values
         """
         try:
-            return self.config.getboolean(section, option)
-        except (configparser.NoSectionError, configparser.NoOptionError, ValueError):
-            if fallback is not None:
-                return fallback
-            
-            # Try to get from defaults
-            try:
-                return self.config.getboolean(self.defaults[section][option])
-            except (KeyError, ValueError):
-                logging.warning(f"Configuration {section}.{option} not found or not a boolean")
-                return False
+            interval_minutes = self.config.getint('Settings', 'interval_minutes', fallback=5)
+        except ValueError:
+            logging.warning("Configuration Settings.interval_minutes is not an integer")
+            interval_minutes = 5
+        
+        if interval_minutes <= 0:
+            logging.warning("Configuration Settings.interval_minutes must be greater than 0")
+            interval_minutes = 5
+        
+        return _SettingsValues(
+            interval_minutes=interval_minutes,
+            log_level=self.config.get('Logging', 'log_level', fallback='INFO'),
+            log_file=self.config.get('Logging', 'log_file', fallback='app.log')
+        )
     
     def get_interval_minutes(self) -> int:
         """
@@ -187,7 +160,7 @@ class Settings:
         Returns:
             The interval in minutes as an integer
         """
-        return self.get_int('Settings', 'interval_minutes', 5)
+        return self._values.interval_minutes
     
     def get_log_level(self) -> str:
         """
@@ -196,7 +169,7 @@ class Settings:
         Returns:
             The log level as a string
         """
-        return self.get('Logging', 'log_level', 'INFO')
+        return self._values.log_level
     
     def get_log_file(self) -> str:
         """
@@ -205,4 +178,4 @@ class Settings:
         Returns:
             The log file path as a string
         """
-        return self.get('Logging', 'log_file', 'app.log')
+        return self._values.log_file
@@ -2,8 +2,9 @@
 Utility functions for file operations.
 """
 import os
+import stat
 import logging
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 
 class AudioFileManager:
@@ -12,6 +13,7 @@ class AudioFileManager:
     """
     # Supported audio file extensions
     SUPPORTED_EXTENSIONS = ('.wav', '.mp3', '.ogg')
+    _EXT_SET = frozenset(SUPPORTED_EXTENSIONS)
     
     def __init__(self, input_dir: str = "input"):
         """
@@ -22,35 +24,68 @@ class AudioFileManager:
         """
         self.input_dir = input_dir
         
+        # Cached scan result and the directory mtime it belongs to
+        self._cache: Optional[List[str]] = None
+        self._cache_mtime_ns = -1
+        
+        # Incremented on every rescan of the input directory
+        self._scan_generation = 0
+        
     def get_audio_files(self) -> List[str]:
         """
         Get a list of audio files in the input directory.
         
+        The directory is only scanned again when its modification time changed
+        since the previous call.
+        
         Returns:
             List of audio file paths
         """
-        if not os.path.exists(self.input_dir):
-            logging.error(f"Input directory '{self.input_dir}' does not exist")
+        try:
+            st = os.stat(self.input_dir)
+        except FileNotFoundError:
+            logging.error("Input directory '%s' does not exist", self.input_dir)
+            self._cache = None
             return []
         
-        audio_files = []
+        if st.st_mtime_ns == self._cache_mtime_ns and self._cache is not None:
+            return self._cache
         
         try:
-            for file in os.listdir(self.input_dir):
-                file_path = os.path.join(self.input_dir, file)
-                
-                # Check if it's a file and has a supported extension
-                if os.path.isfile(file_path) and self._is_supported_audio_file(file):
-                    audio_files.append(file_path)
+            # scandir entries carry the file type from the directory read
+            with os.scandir(self.input_dir) as entries:
+                audio_files = [
+                    entry.path for entry in entries
+                    if entry.is_file() and self._is_supported_audio_file(entry.name)
+                ]
         except Exception as e:
-            logging.error(f"Error listing files in '{self.input_dir}': {e}")
+            logging.error("Error listing files in '%s': %s", self.input_dir, e)
             return []
         
         if not audio_files:
-            logging.warning(f"No audio files found in '{self.input_dir}'")
+            logging.warning("No audio files found in '%s'", self.input_dir)
+        
+        self._cache = audio_files
+        self._cache_mtime_ns = st.st_mtime_ns
+        self._scan_generation += 1
         
         return audio_files
     
+    def get_scan_generation(self) -> int:
+        """
+        Get a counter that changes whenever the input directory was rescanned.
+        
+        Adding, removing or renaming files changes the modification time of the
+        input directory and leads to a rescan, so callers holding data derived
+        from the file list can compare this value to know when to reload it.
+        Overwriting a file in place does not change the directory and has to
+        be detected from the file itself.
+        
+        Returns:
+            The scan generation as an integer
+        """
+        return self._scan_generation
+    
     def _is_supported_audio_file(self, filename: str) -> bool:
         """
         Check if the file has a supported audio extension.
@@ -61,7 +96,7 @@ class AudioFileManager:
         Returns:
             True if the file has a supported extension, False otherwise
         """
-        return filename.lower().endswith(self.SUPPORTED_EXTENSIONS)
+        return os.path.splitext(filename)[1].lower() in self._EXT_SET
     
     def validate_audio_file(self, file_path: str) -> Tuple[bool, str]:
         """
@@ -73,20 +108,21 @@ class AudioFileManager:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        if not os.path.exists(file_path):
-            return False, f"File '{file_path}' does not exist"
-        
-        if not os.path.isfile(file_path):
-            return False, f"'{file_path}' is not a file"
-        
         if not self._is_supported_audio_file(file_path):
             return False, f"File '{file_path}' is not a supported audio file"
         
-        # Check if the file is readable
         try:
-            with open(file_path, 'rb') as f:
-                # Just read a small part to check if it's readable
-                f.read(1024)
-            return True, ""
-        except Exception as e:
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            return False, f"File '{file_path}' does not exist"
+        except OSError as e:
             return False, f"Error reading file '{file_path}': {e}"
+        
+        if not stat.S_ISREG(st.st_mode):
+            return False, f"'{file_path}' is not a file"
+        
+        # Check permissions only, the file content is not read
+        if not os.access(file_path, os.R_OK):
+            return False, f"File '{file_path}' is not readable"
+        
+        return True, ""